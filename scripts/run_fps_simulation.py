@@ -6,20 +6,25 @@ Returns JSON data for visualization.
 
 import sys
 import os
-import json
 import argparse
-import numpy as np
+import orjson
 
 # Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from fps.dynamics import FPSDynamics
-from fps.metrics import FPSMetrics
-from fps.config import create_default_config
+SRC_DIR = os.path.join(os.path.dirname(__file__), '..', 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
 
 
 def run_simulation_for_frontend(config_override=None):
-    """Run FPS simulation and return results for frontend."""
+    """
+    Run FPS simulation and return results for frontend.
+    Long-lived servers should import and call this directly rather than
+    spawning the script per request, so NumPy/SciPy are imported only once.
+    """
+    # Imported here so `--help` and argument errors don't pay the NumPy/SciPy import cost
+    from fps.dynamics import FPSDynamics
+    from fps.metrics import FPSMetrics
+    from fps.config import create_default_config
     
     # Create configuration (smaller for faster frontend response)
     config = create_default_config(N=5, T=20.0, seed=42)
@@ -35,12 +40,12 @@ def run_simulation_for_frontend(config_override=None):
     metrics_engine = FPSMetrics(results)
     validation = metrics_engine.run_all_validations()
     
-    # Format for frontend
+    # Format for frontend (arrays are serialized natively by orjson)
     frontend_data = {
-        't': results['time'].tolist(),
-        'S': results['S'].tolist(),
-        'C': results['C'].tolist(),
-        'r': results['r'].tolist(),
+        't': results['time'],
+        'S': results['S'],
+        'C': results['C'],
+        'r': results['r'],
         'validation': {
             'all_passed': validation['all_passed'],
             'pass_rate': validation['summary']['pass_rate'],
@@ -52,6 +57,12 @@ def run_simulation_for_frontend(config_override=None):
     return frontend_data
 
 
+def to_json(data) -> str:
+    """Serialize frontend data, including NumPy arrays, to a JSON string."""
+    return orjson.dumps(data, default=lambda o: o.tolist(),
+                        option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
 def main():
     parser = argparse.ArgumentParser(description='Run FPS simulation for frontend')
     parser.add_argument('--json', action='store_true', help='Output JSON format')
@@ -77,14 +88,14 @@ def main():
         
         if args.json:
             # Output JSON for frontend
-            print(json.dumps(results))
+            print(to_json(results))
         else:
             # Human-readable output
             print(f"FPS Simulation Results:")
             print(f"- Time points: {len(results['t'])}")
-            print(f"- S(t) range: [{min(results['S']):.3f}, {max(results['S']):.3f}]")
-            print(f"- C(t) range: [{min(results['C']):.3f}, {max(results['C']):.3f}]")
-            print(f"- r(t) range: [{min(results['r']):.3f}, {max(results['r']):.3f}]")
+            print(f"- S(t) range: [{results['S'].min():.3f}, {results['S'].max():.3f}]")
+            print(f"- C(t) range: [{results['C'].min():.3f}, {results['C'].max():.3f}]")
+            print(f"- r(t) range: [{results['r'].min():.3f}, {results['r'].max():.3f}]")
             print(f"- Validation passed: {results['validation']['all_passed']}")
             print(f"- Pass rate: {results['validation']['pass_rate']:.1%}")
             
@@ -97,7 +108,7 @@ def main():
                 'error': 'Simulation failed',
                 'details': str(e)
             }
-            print(json.dumps(error_response))
+            print(to_json(error_response))
             sys.exit(1)
         else:
             print(f"Error: {e}")
@@ -212,7 +212,8 @@ def run_golden_test():
     
     hash_path = 'validation_artifacts/golden/golden_hashes.json'
     with open(hash_path, 'w') as f:
-        json.dump(hash_record, f, indent=2, default=str)
+        json.dump(hash_record, f, indent=2,
+                  default=lambda o: o.tolist() if isinstance(o, np.ndarray) else str(o))
     
     print(f"Golden reference test completed!")
     print(f"CSV hash: {csv_hash}")
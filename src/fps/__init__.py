@@ -1,6 +1,15 @@
 """FPS Simulation Toolkit package."""
 
-from .simulate import FPSSimulation
-from .parameters import RunConfig
-
 __all__ = ["FPSSimulation", "RunConfig"]
+
+
+def __getattr__(name):
+    # Loaded on first access so importing a submodule such as fps.dynamics
+    # does not pull in pydantic, pandas and scipy.stats through simulate/metrics
+    if name == "FPSSimulation":
+        from .simulate import FPSSimulation
+        return FPSSimulation
+    if name == "RunConfig":
+        from .parameters import RunConfig
+        return RunConfig
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
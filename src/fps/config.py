@@ -11,8 +11,9 @@ import json
 def create_default_config(N: int = 20, T: float = 20.0, seed: int = 42) -> Dict:
     """
     Create default FPS configuration with parameters matching math.md specifications exactly.
+    Random strate parameters are float64 arrays drawn from a generator local to this call.
     """
-    np.random.seed(seed)
+    rng = np.random.RandomState(seed)
     
     return {
         'system': {
@@ -28,10 +29,10 @@ def create_default_config(N: int = 20, T: float = 20.0, seed: int = 42) -> Dict:
             'theta': 0.0
         },
         'strates': {
-            'A0': np.random.uniform(0.5, 1.2, N).tolist(),
-            'f0': np.random.uniform(0.1, 1.5, N).tolist(),
+            'A0': rng.uniform(0.5, 1.2, N),
+            'f0': rng.uniform(0.1, 1.5, N),
             'alpha': [0.1] * N,  # Reduced from 0.5 to 0.1 for stability (still within "≈ 0.5" range)
-            'beta': np.random.uniform(0.05, 0.15, N).tolist(),
+            'beta': rng.uniform(0.05, 0.15, N),
             'k': [2.0] * N,  # As specified in math.md (k = 2.0)
             'x0': [0.5] * N, # As specified in math.md (x0 = 0.5)
             'w': [0.01] * N  # Reduced from 0.1 to 0.01 for stability while maintaining mathematical form
@@ -60,12 +61,12 @@ def create_kuramoto_config(N: int = 20, seed: int = 123) -> Dict:
     Create Kuramoto model configuration for control comparison.
     N = 20, K = 0.5, ω_i ~ U[0,1]
     """
-    np.random.seed(seed)
+    rng = np.random.RandomState(seed)
     
     return {
         "N": N,
         "K": 0.5,  # Coupling strength
-        "omega": np.random.uniform(0, 1, N).tolist(),  # Natural frequencies
+        "omega": rng.uniform(0, 1, N),  # Natural frequencies
         "dt": 0.1,
         "T": 20.0,
         "seed": seed
@@ -73,9 +74,9 @@ def create_kuramoto_config(N: int = 20, seed: int = 123) -> Dict:
 
 
 def save_config(config: Dict, filepath: str):
-    """Save configuration to JSON file."""
+    """Save configuration to JSON file (NumPy arrays are written as lists)."""
     with open(filepath, 'w') as f:
-        json.dump(config, f, indent=2)
+        json.dump(config, f, indent=2, default=lambda o: o.tolist())
 
 
 def load_config(filepath: str) -> Dict:
@@ -4,6 +4,7 @@ All 6 fundamental equations as specified in math.md.
 """
 
 import numpy as np
+from scipy.special import expit
 from typing import Dict, List, Tuple, Optional
 import time
 
@@ -13,10 +14,8 @@ def sigma(x: np.ndarray, k: float = 2.0, x0: float = 0.5) -> np.ndarray:
     Standalone sigmoid activation function σ(x) = 1/(1+e^(-k(x-x₀)))
     Used for unit testing. Numerically stable implementation.
     """
-    # Clip extreme values to prevent overflow
-    z = -k * (x - x0)
-    z = np.clip(z, -500, 500)  # Prevent overflow
-    return 1.0 / (1.0 + np.exp(z))
+    # expit is the logistic ufunc, overflow-safe without clipping
+    return expit(k * (x - x0))
 
 
 def compute_spiral_feedback(x: np.ndarray, lambda_val: float = 1.0) -> np.ndarray:
@@ -27,8 +26,31 @@ def compute_spiral_feedback(x: np.ndarray, lambda_val: float = 1.0) -> np.ndarra
     return np.tanh(lambda_val * x)
 
 
-class Stratum:
-    """Individual strate in the FPS system."""
+def _fps_frequency_run(A: np.ndarray, f0: np.ndarray, alpha_w: np.ndarray,
+                       phases: np.ndarray, t_grid: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Equation 2 over the full time grid, written into out[t_idx, :].
+    f_n(t) = max(f₀n + clip(α_n w_n Σᵢ A_i(t) sin(2π f_i(t-1) t + φ_i), -1, 1), 0.01)
+    The recurrence on f(t-1) is sequential; each step runs in place on fixed buffers.
+    Leading batch axes between time and strates, e.g. A of shape (t_steps, B, N), are supported.
+    """
+    S_i = np.empty(np.broadcast_shapes(f0.shape, A.shape[1:]))
+    f_prev = f0
+    for t_idx, t in enumerate(t_grid):
+        # Individual strate signals S_i(t) at the previous frequencies
+        np.multiply(f_prev, 2 * np.pi, out=S_i)
+        S_i *= t
+        S_i += phases
+        np.sin(S_i, out=S_i)
+        S_i *= A[t_idx]
+        
+        f_n = out[t_idx]
+        np.multiply(alpha_w, S_i.sum(axis=-1, keepdims=True), out=f_n)
+        np.clip(f_n, -1.0, 1.0, out=f_n)
+        f_n += f0
+        np.maximum(f_n, 0.01, out=f_n)
+        f_prev = f_n
+    return out
 
 
 class FPSDynamics:
@@ -42,23 +64,25 @@ class FPSDynamics:
         self.dt = config['system'].get('dt', 0.1)  # Time step
         self.seed = config['system']['seed']
         
-        # Set random seed for reproducibility
-        np.random.seed(self.seed)
-        
         # Spiral parameters
         self.phi = config['spiral']['phi']  # Golden ratio ≈ 1.618
         self.epsilon = config['spiral']['epsilon']  # ≈ 0.05
         self.omega = config['spiral']['omega']  # ≈ 0.1
         self.theta = config['spiral']['theta']
         
-        # Per-strate parameters (arrays of length N)
-        self.A0 = np.array(config['strates']['A0'])
-        self.f0 = np.array(config['strates']['f0'])
-        self.alpha = np.array(config['strates']['alpha'])
-        self.beta = np.array(config['strates']['beta'])
-        self.k = np.array(config['strates']['k'])  # Sigmoid steepness
-        self.x0 = np.array(config['strates']['x0'])  # Sigmoid center
-        self.w = np.array(config['strates']['w'])  # Coupling weights (N x N)
+        # Per-strate parameters (arrays of length N, no copy if already float64 arrays)
+        self.A0 = np.asarray(config['strates']['A0'], dtype=np.float64)
+        self.f0 = np.asarray(config['strates']['f0'], dtype=np.float64)
+        self.alpha = np.asarray(config['strates']['alpha'], dtype=np.float64)
+        self.beta = np.asarray(config['strates']['beta'], dtype=np.float64)
+        self.k = np.asarray(config['strates']['k'], dtype=np.float64)  # Sigmoid steepness
+        self.x0 = np.asarray(config['strates']['x0'], dtype=np.float64)  # Sigmoid center
+        self.w = np.asarray(config['strates']['w'], dtype=np.float64)  # Coupling weights (N x N)
+        self._alpha_w = self.alpha * self.w  # Invariant coupling gain α_n w_n
+        
+        # Deterministic per-strate phases φₙ, drawn from a private generator so the
+        # global NumPy RNG state is left untouched
+        self._phases = 2 * np.pi * np.random.RandomState(self.seed).random_sample(self.N)
         
         # Feedback parameters
         self.lambda_feedback = config.get('lambda', 1.0)
@@ -78,23 +102,27 @@ class FPSDynamics:
         self.A_history = np.zeros((self.t_steps, self.N))
         self.f_history = np.zeros((self.t_steps, self.N))
         
-        # For extended form
+        # For extended form (allocated on demand by _allocate_extended)
+        self.gamma_history = None
+        self.E_history = None
+        self.O_history = None
+        
+        # Performance tracking
+        self.cpu_times = np.empty(self.t_steps)
+    
+    def _allocate_extended(self):
+        """Allocate the extended-form histories, only needed when use_extended=True."""
         self.gamma_history = np.zeros((self.t_steps, self.N))
         self.E_history = np.zeros((self.t_steps, self.N))
         self.O_history = np.zeros((self.t_steps, self.N))
-        
-        # Performance tracking
-        self.cpu_times = []
     
     def sigma(self, x: np.ndarray) -> np.ndarray:
         """
         Equation 1: Per-strate amplitude sigmoid function.
         σ(x) = 1/(1 + e^(-k(x-x₀)))
         """
-        # Clip extreme values to prevent overflow
-        z = -self.k * (x - self.x0)
-        z = np.clip(z, -500, 500)  # Prevent overflow
-        return 1.0 / (1.0 + np.exp(z))
+        # expit is the logistic ufunc, overflow-safe without clipping
+        return expit(self.k * (x - self.x0))
     
     def compute_amplitude(self, I_n: np.ndarray, t_idx: int) -> np.ndarray:
         """
@@ -110,17 +138,12 @@ class FPSDynamics:
         
         Proper implementation using individual strate signals S_i(t) = A_i(t) sin(2π f_i(t) t + φ_i)
         """
-        # Use deterministic phases for reproducibility
-        if not hasattr(self, '_phases'):
-            np.random.seed(self.seed)  # Ensure reproducible phases
-            self._phases = 2 * np.pi * np.random.random(self.N)
-        
         # Compute individual strate signals S_i(t)
         S_i = A_n * np.sin(2 * np.pi * f_n_prev * t + self._phases)
         
         # Frequency modulation: Δf_n = α_n * w_n * Σᵢ S_i(t)
         # For simplicity, using scalar w_n instead of full matrix w_{ni}
-        delta_f = self.alpha * self.w * np.sum(S_i)
+        delta_f = self._alpha_w * S_i.sum()
         
         # Add numerical stability: clip extreme frequency changes
         delta_f = np.clip(delta_f, -1.0, 1.0)  # Prevent extreme frequency excursions
@@ -131,10 +154,11 @@ class FPSDynamics:
         
         return f_new
     
-    def compute_spiral_ratio(self, t: float) -> float:
+    def compute_spiral_ratio(self, t):
         """
         Equation 5: Spiral ratio driver
         r(t) = φ + ε sin(2πωt + θ)
+        Accepts a scalar t or an array of times.
         """
         return self.phi + self.epsilon * np.sin(2 * np.pi * self.omega * t + self.theta)
     
@@ -150,11 +174,6 @@ class FPSDynamics:
         Equation 3: Global signal (canonical form)
         S(t) = Σₙ A_n(t) sin(2π f_n(t) t + φₙ)
         """
-        # Use deterministic phases for reproducibility (initialized once)
-        if not hasattr(self, '_phases'):
-            np.random.seed(self.seed)  # Ensure reproducible phases
-            self._phases = 2 * np.pi * np.random.random(self.N)
-        
         signal = np.sum(A_n * np.sin(2 * np.pi * f_n * t + self._phases))
         
         # Add numerical stability: normalize by number of strates to prevent blow-ups
@@ -169,11 +188,6 @@ class FPSDynamics:
         Equation 3: Global signal (extended FPS form with feedback + latency)
         S(t) = Σₙ A_n(t) γ_n(t) sin(2π f_n(t) t + φₙ) G(E_n(t) - O_n(t))
         """
-        # Use deterministic phases for reproducibility
-        if not hasattr(self, '_phases'):
-            np.random.seed(self.seed)  # Ensure reproducible phases
-            self._phases = 2 * np.pi * np.random.random(self.N)
-        
         feedback_term = self.spiral_feedback(E_n - O_n)
         signal = np.sum(A_n * gamma_n * np.sin(2 * np.pi * f_n * t + self._phases) * feedback_term)
         
@@ -191,14 +205,17 @@ class FPSDynamics:
         A_n = self.A_history[-1, n] if len(self.A_history) > 0 else self.A0[n]
         f_n = self.f_history[-1, n] if len(self.f_history) > 0 else self.f0[n]
         
-        # Sinc function (sin(πx)/(πx))
-        arg = f_n * (x - mu_n)
-        sinc_term = np.sinc(arg)  # NumPy sinc is sin(πx)/(πx)
+        # Offset from the kernel center, shared by both factors
+        d = np.subtract(x, mu_n, dtype=np.float64)
+        
+        # Sinc function (sin(πx)/(πx)), NumPy's sinc handles x = 0
+        kernel = np.sinc(f_n * d)
         
-        # Gaussian envelope
-        gaussian_term = np.exp(-(x - mu_n)**2 / (2 * sigma_n**2))
+        # Gaussian envelope, folded into the sinc result in place
+        kernel *= np.exp(d * d * (-0.5 / sigma_n**2))
+        kernel *= A_n
         
-        return A_n * sinc_term * gaussian_term
+        return kernel
     
     def compute_coherence(self, S: float, r: float) -> float:
         """
@@ -219,61 +236,51 @@ class FPSDynamics:
         Returns:
             Dictionary with all simulation results
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
+        
+        # Equation 5: Spiral ratio, and the derived coherence, depend only on t
+        # and are independent of the strate state, so both are one vector op each
+        self.r_history[:] = self.compute_spiral_ratio(self.time)
+        self.C_history[:] = np.exp(-np.abs(self.r_history - self.phi))
         
         # Generate input scenarios I_n(t)
         I_scenarios = self._generate_input_scenarios(input_scenario)
         
         # Initialize extended form variables if needed
         if use_extended:
-            gamma_n = np.ones((self.t_steps, self.N))  # Placeholder
-            E_n = np.random.normal(0, 0.1, (self.t_steps, self.N))  # Environment
-            O_n = np.random.normal(0, 0.1, (self.t_steps, self.N))  # Output
-        
-        # Main simulation loop
-        for t_idx, t in enumerate(self.time):
-            step_start = time.time()
-            
-            # Current inputs
-            I_n = I_scenarios[t_idx, :]
-            
-            # Equation 1: Compute amplitudes
-            A_n = self.compute_amplitude(I_n, t_idx)
-            self.A_history[t_idx, :] = A_n
-            
-            # Equation 2: Compute frequencies
-            f_n_prev = self.f_history[t_idx-1, :] if t_idx > 0 else self.f0
-            f_n = self.compute_frequency_modulation(A_n, f_n_prev, t, t_idx)
-            self.f_history[t_idx, :] = f_n
-            
-            # Equation 5: Compute spiral ratio
-            r_t = self.compute_spiral_ratio(t)
-            self.r_history[t_idx] = r_t
-            
-            # Equation 3: Compute global signal
-            if use_extended:
-                gamma_n_t = gamma_n[t_idx, :]
-                E_n_t = E_n[t_idx, :]
-                O_n_t = O_n[t_idx, :]
-                self.gamma_history[t_idx, :] = gamma_n_t
-                self.E_history[t_idx, :] = E_n_t
-                self.O_history[t_idx, :] = O_n_t
-                
-                S_t = self.compute_global_signal_extended(A_n, f_n, gamma_n_t, E_n_t, O_n_t, t)
-            else:
-                S_t = self.compute_global_signal_canonical(A_n, f_n, t)
-            
-            self.S_history[t_idx] = S_t
-            
-            # Compute coherence (derived metric)
-            C_t = self.compute_coherence(S_t, r_t)
-            self.C_history[t_idx] = C_t
-            
-            # Track CPU time per step
-            step_time = time.time() - step_start
-            self.cpu_times.append(step_time)
-        
-        total_time = time.time() - start_time
+            self._allocate_extended()
+            # Dedicated stream, independent of the phase generator and global RNG state;
+            # an unseeded run (seed None) draws fresh OS entropy, as the phases do
+            rng = np.random.default_rng(None if self.seed is None else self.seed + 1)
+            self.gamma_history[:] = 1.0  # Placeholder
+            self.E_history[:] = rng.normal(0, 0.1, (self.t_steps, self.N))  # Environment
+            self.O_history[:] = rng.normal(0, 0.1, (self.t_steps, self.N))  # Output
+        
+        # Equation 1: Amplitudes over the full (t_steps, N) grid
+        self.A_history[:] = self.A0 * self.sigma(I_scenarios)
+        
+        # Equation 2: Frequencies form a recurrence on f_n(t-1), so only this stays sequential
+        _fps_frequency_run(self.A_history, self.f0, self._alpha_w, self._phases,
+                           self.time, out=self.f_history)
+        
+        # Equation 3: Global signal, batched over the full time grid
+        # sin(2π f_n t + φₙ) built in place in a single (t_steps, N) table
+        S_i = np.multiply(self.f_history, 2 * np.pi)
+        S_i *= self.time[:, None]
+        S_i += self._phases
+        np.sin(S_i, out=S_i)
+        S_i *= self.A_history
+        if use_extended:
+            S_i *= self.gamma_history
+            S_i *= self.spiral_feedback(self.E_history - self.O_history)
+        
+        # Normalize by number of strates to prevent blow-ups
+        self.S_history[:] = S_i.sum(axis=1) / self.N
+        
+        total_time = time.perf_counter() - start_time
+        
+        # Per-step cost is amortized over the batched run
+        self.cpu_times[:] = total_time / self.t_steps
         
         return {
             'time': self.time,
@@ -285,26 +292,24 @@ class FPSDynamics:
             'gamma': self.gamma_history if use_extended else None,
             'E': self.E_history if use_extended else None,
             'O': self.O_history if use_extended else None,
-            'cpu_times': np.array(self.cpu_times),
+            'cpu_times': self.cpu_times,
             'total_time': total_time,
             'config': self.config
         }
     
     def _generate_input_scenarios(self, scenario: str) -> np.ndarray:
         """Generate input scenarios I_n(t) for all strates."""
-        I_scenarios = np.zeros((self.t_steps, self.N))
-        
-        for t_idx, t in enumerate(self.time):
-            if scenario == "constant":
-                I_scenarios[t_idx, :] = 0.3
-            elif scenario == "step":
-                I_scenarios[t_idx, :] = 1.0 if t >= self.T/4 else 0.3
-            elif scenario == "ramp":
-                I_scenarios[t_idx, :] = t / self.T
-            else:
-                raise ValueError(f"Unknown scenario: {scenario}")
-        
-        return I_scenarios
+        if scenario == "constant":
+            I_t = np.full(self.t_steps, 0.3)
+        elif scenario == "step":
+            I_t = np.where(self.time >= self.T/4, 1.0, 0.3)
+        elif scenario == "ramp":
+            I_t = self.time / self.T
+        else:
+            raise ValueError(f"Unknown scenario: {scenario}")
+        
+        # Same input for every strate: read-only (t_steps, N) view, no per-strate copy
+        return np.broadcast_to(I_t[:, None], (self.t_steps, self.N))
     
     # Helper methods for testing
     def _compute_S(self, A: np.ndarray, phi: np.ndarray) -> float:
@@ -315,4 +320,72 @@ class FPSDynamics:
         """Helper method for testing: compute frequency modulation for scalar case."""
         # For testing, return the change in frequency for first strate
         # Using simplified approach for backward compatibility with tests
-        return self.alpha[0] * self.w[0] * S 
\ No newline at end of file
+        return self.alpha[0] * self.w[0] * S 
+
+
+def run_batch(configs: List[Dict], input_scenario: str = "constant") -> Dict:
+    """
+    Run the canonical FPS simulation for many configs at once (e.g. seed or
+    parameter sweeps), stacking trajectories on a leading batch axis.
+    
+    All configs must share N, T and dt. Each trajectory matches what
+    FPSDynamics(config).run_simulation(input_scenario) returns for that config.
+    
+    Returns:
+        Dictionary with 'S', 'C', 'r' of shape (B, t_steps) and 'A', 'f' of
+        shape (B, t_steps, N)
+    """
+    models = [FPSDynamics(config) for config in configs]
+    if not models:
+        raise ValueError("run_batch needs at least one config")
+    
+    ref = models[0]
+    for model in models[1:]:
+        if (model.N, model.T, model.dt) != (ref.N, ref.T, ref.dt):
+            raise ValueError(
+                f"Batched configs must share N, T and dt: got {(model.N, model.T, model.dt)} "
+                f"vs {(ref.N, ref.T, ref.dt)}"
+            )
+    
+    start_time = time.perf_counter()
+    
+    def stack(attr: str) -> np.ndarray:
+        return np.stack([getattr(model, attr) for model in models])
+    
+    # Spiral parameters as (B, 1) columns, per-strate parameters as (B, N)
+    phi, epsilon, omega, theta = (stack(attr)[:, None] for attr in ('phi', 'epsilon', 'omega', 'theta'))
+    A0, f0, k, x0 = stack('A0'), stack('f0'), stack('k'), stack('x0')
+    alpha_w, phases = stack('_alpha_w'), stack('_phases')
+    t = ref.time
+    
+    # Equation 5 and coherence, (B, t_steps)
+    r = phi + epsilon * np.sin(2 * np.pi * omega * t + theta)
+    C = np.exp(-np.abs(r - phi))
+    
+    # Equation 1, time-major (t_steps, B, N) so each recurrence step reads a contiguous slab
+    I_scenarios = ref._generate_input_scenarios(input_scenario)[:, None, :]
+    A = A0 * expit(k * (I_scenarios - x0))
+    
+    # Equation 2, one sequential pass shared by the whole batch
+    f = _fps_frequency_run(A, f0, alpha_w, phases, t, out=np.empty_like(A))
+    
+    # Equation 3
+    S_i = np.multiply(f, 2 * np.pi)
+    S_i *= t[:, None, None]
+    S_i += phases
+    np.sin(S_i, out=S_i)
+    S_i *= A
+    S = S_i.sum(axis=-1).T / ref.N
+    
+    total_time = time.perf_counter() - start_time
+    
+    return {
+        'time': t,
+        'S': S,
+        'C': C,
+        'r': r,
+        'A': A.transpose(1, 0, 2),
+        'f': f.transpose(1, 0, 2),
+        'total_time': total_time,
+        'configs': configs
+    }
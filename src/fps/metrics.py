@@ -3,23 +3,119 @@ FPS validation metrics implementing all pass/fail criteria from math.md.
 All assertions = the paper's bold claims. Make them pass, or the math isn't proven.
 """
 
+import math
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 import pandas as pd
+from scipy.ndimage import maximum_filter1d, median_filter, rank_filter
 from scipy.stats import entropy
 import warnings
 from .strata import Stratum
 
 
+def coherence_arr(phases: np.ndarray) -> float:
+    # mean(cos(φ - mean_phase)) is the resultant length of the unit phasors
+    sx = np.cos(phases).sum()
+    sy = np.sin(phases).sum()
+    return math.sqrt(sx * sx + sy * sy) / len(phases)
+
+
+def effort_arr(A: np.ndarray) -> float:
+    # simple placeholder effort as sum of amplitudes
+    return float(np.abs(A).sum())
+
+
 def coherence(strata: list[Stratum]) -> float:
-    phases = np.array([s.φ for s in strata])
-    mean_phase = np.angle(np.mean(np.exp(1j * phases)))
-    return float(np.mean(np.cos(phases - mean_phase)))
+    return coherence_arr(np.array([s.φ for s in strata]))
 
 
 def effort(strata: list[Stratum]) -> float:
-    # simple placeholder effort as sum of amplitudes
-    return float(sum(abs(s.A) for s in strata))
+    return effort_arr(np.array([s.A for s in strata]))
+
+
+def _second_gradient(S: np.ndarray) -> np.ndarray:
+    """
+    np.gradient(np.gradient(S)) in one pass: the interior is the stride-2 stencil
+    (S[i+2] - 2 S[i] + S[i-2]) / 4 and the two samples at each end follow
+    np.gradient's one-sided edge differences.
+    """
+    S = np.asarray(S, dtype=np.float64)
+    if len(S) < 4:
+        return np.gradient(np.gradient(S))
+    d2S = np.empty_like(S)
+    inner = d2S[2:-2]
+    np.add(S[4:], S[:-4], out=inner)
+    inner -= 2 * S[2:-2]
+    inner /= 4
+    g0, g1, g2 = S[1] - S[0], (S[2] - S[0]) / 2, (S[3] - S[1]) / 2
+    d2S[0], d2S[1] = g1 - g0, (g2 - g0) / 2
+    g0, g1, g2 = S[-1] - S[-2], (S[-1] - S[-3]) / 2, (S[-2] - S[-4]) / 2
+    d2S[-1], d2S[-2] = g0 - g1, (g0 - g2) / 2
+    return d2S
+
+
+def _rolling_max_median(x: np.ndarray, w: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Max and median of every trailing window x[i-w:i+1], for i in [w, len(x)).
+    Uses SciPy's C rank filters; even-sized windows average the two middle
+    ranks, matching np.median.
+    """
+    size = w + 1
+    # Anchor each filter window at its last sample, then drop the partial leading windows
+    kwargs = dict(size=size, origin=w - size // 2, mode='nearest')
+    maxes = maximum_filter1d(x, **kwargs)[w:]
+    if size % 2:
+        medians = median_filter(x, **kwargs)[w:]
+    else:
+        lower = rank_filter(x, rank=size // 2 - 1, **kwargs)[w:]
+        upper = rank_filter(x, rank=size // 2, **kwargs)[w:]
+        medians = (lower + upper) / 2
+    return maxes, medians
+
+
+def _rolling_entropy(x: np.ndarray, w: int, bins: int = 20) -> np.ndarray:
+    """
+    Entropy of the normalised density histogram of every trailing window
+    x[i-w:i+1], for i in [w, len(x)). Each window is binned over its own
+    [min, max] range exactly as np.histogram(window, bins, density=True) does,
+    but all windows are binned and counted together.
+    """
+    if len(x) <= w:
+        return np.empty(0)
+    windows = np.lib.stride_tricks.sliding_window_view(x, w + 1)
+    entropies = np.empty(len(windows))
+    
+    # Row blocks keep the (rows, w+1) index temporaries bounded for long signals
+    block = max(1, 2**20 // (w + 1))
+    for start in range(0, len(windows), block):
+        win = windows[start:start + block]
+        rows = len(win)
+        
+        # Per-window range and np.linspace bin edges (flat windows widened by ±0.5)
+        lo = win.min(axis=1)
+        hi = win.max(axis=1)
+        flat = lo == hi
+        lo = np.where(flat, lo - 0.5, lo)[:, None]
+        hi = np.where(flat, hi + 0.5, hi)[:, None]
+        edges = np.arange(bins + 1) * ((hi - lo) / bins) + lo
+        edges[:, -1:] = hi
+        
+        # Bin indices, with np.histogram's ±1 ULP edge corrections
+        idx = ((win - lo) / (hi - lo) * bins).astype(np.intp)
+        idx[idx == bins] -= 1
+        idx[win < np.take_along_axis(edges, idx, axis=1)] -= 1
+        idx[(win >= np.take_along_axis(edges, idx + 1, axis=1)) & (idx != bins - 1)] += 1
+        
+        # One bincount for all windows, offsetting each row into its own bin range
+        idx += np.arange(rows)[:, None] * bins
+        counts = np.bincount(idx.ravel(), minlength=rows * bins).reshape(rows, bins)
+        
+        hist = counts / np.diff(edges, axis=1) / counts.sum(axis=1, keepdims=True)
+        hist = hist + 1e-10  # Avoid log(0)
+        hist = hist / hist.sum(axis=1, keepdims=True)  # Normalize
+        entropies[start:start + rows] = entropy(hist, axis=1)
+    
+    return entropies
 
 
 class FPSMetrics:
@@ -28,11 +124,12 @@ class FPSMetrics:
     def __init__(self, results: Dict):
         """Initialize with simulation results."""
         self.results = results
-        self.time = results['time']
-        self.S = results['S']
-        self.C = results['C']
-        self.r = results['r']
-        self.cpu_times = results['cpu_times']
+        # Converted once here so the metrics below never re-coerce lists or views
+        self.time = np.ascontiguousarray(results['time'], dtype=np.float64)
+        self.S = np.ascontiguousarray(results['S'], dtype=np.float64)
+        self.C = np.ascontiguousarray(results['C'], dtype=np.float64)
+        self.r = np.ascontiguousarray(results['r'], dtype=np.float64)
+        self.cpu_times = np.ascontiguousarray(results['cpu_times'], dtype=np.float64)
         self.failures = []  # Track criterion failures
     
     def compute_fluidity(self) -> Tuple[float, bool]:
@@ -41,7 +138,7 @@ class FPSMetrics:
         Distinguishes living spiral from chaotic oscillator.
         """
         # Compute second derivative of S
-        d2S = np.gradient(np.gradient(self.S))
+        d2S = _second_gradient(self.S)
         variance_d2S = np.var(d2S)
         
         passed = variance_d2S < 0.01
@@ -63,19 +160,15 @@ class FPSMetrics:
         """
         # Compute ratio for each time step (using rolling window)
         window_size = max(1, len(self.S) // 20)  # 5% window
-        ratios = []
-        
-        for i in range(window_size, len(self.S)):
-            window = self.S[i-window_size:i+1]
-            if np.median(window) != 0:
-                ratio = np.max(window) / np.median(window)
-                ratios.append(ratio)
+        maxes, medians = _rolling_max_median(self.S, window_size)
+        nonzero = medians != 0
+        ratios = maxes[nonzero] / medians[nonzero]
         
         if len(ratios) == 0:
-            ratios = [float('inf')]
+            ratios = np.array([float('inf')])
         
         # Check percentage of steps satisfying condition
-        stable_steps = np.sum(np.array(ratios) < 10)
+        stable_steps = np.sum(ratios < 10)
         percentage_stable = stable_steps / len(ratios) if len(ratios) > 0 else 0
         
         passed = percentage_stable >= 0.95
@@ -116,11 +209,10 @@ class FPSMetrics:
             baseline = np.mean(self.S[:shock_idx]) if shock_idx > 0 else self.S[0]
             tolerance = 0.1 * np.std(self.S[:shock_idx]) if shock_idx > 0 else 0.1
             
-            for i in range(shock_idx + 1, len(self.S)):
-                if abs(self.S[i] - baseline) < tolerance:
-                    return_time = self.time[i] - shock_time
-                    return_times.append(return_time)
-                    break
+            returned = np.flatnonzero(np.abs(self.S[shock_idx + 1:] - baseline) < tolerance)
+            if len(returned):
+                return_time = self.time[shock_idx + 1 + returned[0]] - shock_time
+                return_times.append(return_time)
         
         if len(return_times) == 0:
             return 0.0, True
@@ -146,24 +238,13 @@ class FPSMetrics:
         """
         # Compute entropy using rolling windows
         window_size = max(10, len(self.S) // 50)  # Adaptive window
-        entropies = []
-        
-        for i in range(window_size, len(self.S)):
-            window = self.S[i-window_size:i+1]
-            # Discretize for entropy calculation
-            bins = 20
-            hist, _ = np.histogram(window, bins=bins, density=True)
-            hist = hist + 1e-10  # Avoid log(0)
-            hist = hist / np.sum(hist)  # Normalize
-            
-            ent = entropy(hist)
-            entropies.append(ent)
+        entropies = _rolling_entropy(self.S, window_size, bins=20)
         
         if len(entropies) == 0:
             return 0.0, False
         
         # Check percentage of steps with sufficient entropy
-        high_entropy_steps = np.sum(np.array(entropies) > 0.5)
+        high_entropy_steps = np.sum(entropies > 0.5)
         percentage_innovative = high_entropy_steps / len(entropies)
         
         passed = percentage_innovative >= 0.70
@@ -202,13 +283,12 @@ class FPSMetrics:
         # Compute |E-O| for each strate
         EO_diff = np.abs(E_half - O_half)
         
-        # Rolling mean across time and strates
+        # Rolling mean across time and strates over windows EO_diff[i-w:i+1],
+        # from a cumulative sum of per-step totals
         window_size = max(10, len(EO_diff) // 10)
-        rolling_means = []
-        
-        for i in range(window_size, len(EO_diff)):
-            window = EO_diff[i-window_size:i+1]
-            rolling_means.append(np.mean(window))
+        csum = np.concatenate([[0.0], np.cumsum(EO_diff.sum(axis=1))])
+        window_count = (window_size + 1) * EO_diff.shape[1]
+        rolling_means = (csum[window_size + 1:] - csum[:-window_size - 1]) / window_count
         
         if len(rolling_means) == 0:
             return 0.0, True
@@ -236,8 +316,10 @@ class FPSMetrics:
         Golden-ratio convergence for minimal beat patterns.
         """
         phi = 1.618  # Golden ratio
-        deviations = np.abs(self.r - phi)
-        mean_deviation = np.mean(deviations)
+        # One temporary, reused in place for the abs
+        deviations = np.subtract(self.r, phi, dtype=np.float64)
+        np.abs(deviations, out=deviations)
+        mean_deviation = deviations.mean()
         
         # Threshold based on epsilon parameter (typically 0.05)
         threshold = 0.1  # Allow some deviation
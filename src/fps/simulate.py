@@ -3,9 +3,60 @@ import time
 import csv
 from pathlib import Path
 from .parameters import RunConfig
-from .strata import Stratum
+from .strata import StrataState
 from .spiral import G_factory
-from .metrics import coherence, effort
+from .metrics import coherence_arr, effort_arr
+
+_FLUSH_ROWS = 1000  # logged rows held in memory between writes
+_BLOCK_ELEMENTS = 2**16  # steps × strata of increments tabulated at a time
+_FAST_WRAP_MIN_STRATA = 512  # below this np.remainder beats the masked compare/subtract
+
+
+def _phase_steps_bounded(state: StrataState, df: np.ndarray, Δt: float) -> bool:
+    """True if every phase starts in [0, 2π) and no step can advance it by half a turn.
+
+    |f| never exceeds its initial value plus the largest per-step increments, so this
+    is checked once per increment table instead of inside the step loop.
+    """
+    f_bound = np.abs(state.f).max() + np.abs(df).max(axis=1).sum()
+    return bool(state.φ.min() >= 0 and state.φ.max() < 2 * np.pi and f_bound * Δt < 0.5)
+
+
+def _wrap_phase(φ: np.ndarray, mask: np.ndarray) -> None:
+    """Wrap φ into [0, 2π) in place, given it lies within one turn of that range.
+
+    Same values as np.remainder there, but a compare and masked subtract per side
+    instead of a division.
+    """
+    np.greater_equal(φ, 2 * np.pi, out=mask)
+    np.subtract(φ, 2 * np.pi, out=φ, where=mask)
+    np.less(φ, 0.0, out=mask)
+    np.add(φ, 2 * np.pi, out=φ, where=mask)
+
+
+def _run_kernel(state: StrataState, dA: np.ndarray, df: np.ndarray, Δt: float,
+                start: int, stop: int, fast_wrap: bool = False) -> None:
+    """Advance state in place through steps [start, stop) of the Eq. (1) discretisation.
+
+    dA and df are the per-step amplitude and frequency increments. They depend only
+    on the noise, so they are tabulated a block of steps at a time; start and stop
+    index into that block.
+    fast_wrap replaces np.remainder with _wrap_phase and requires
+    _phase_steps_bounded to hold.
+    """
+    dφ = np.empty_like(state.φ)
+    mask = np.empty(state.φ.shape, dtype=bool)
+    for k in range(start, stop):
+        state.A += dA[k]
+        state.f += df[k]
+        np.multiply(state.f, 2 * np.pi, out=dφ)
+        dφ *= Δt
+        if fast_wrap:
+            state.φ += dφ
+            _wrap_phase(state.φ, mask)
+        else:
+            dφ += state.φ
+            np.remainder(dφ, 2 * np.pi, out=state.φ)
 
 
 class FPSSimulation:
@@ -14,57 +65,91 @@ class FPSSimulation:
         self.G = G_factory(cfg.feedback.G)
         rng = np.random.default_rng(cfg.seed)
         self.noise = rng
-        self.strata = [
-            Stratum(
-                cfg.strata_defaults.A0,
-                cfg.strata_defaults.f0,
-                cfg.strata_defaults.φ0,
-                cfg.strata_defaults.γ0,
-                cfg.strata_defaults.α,
-                cfg.strata_defaults.β,
-                cfg.strata_defaults.λ,
-            )
-            for _ in range(cfg.n_strata)
-        ]
+        self.state = StrataState.from_defaults(cfg.strata_defaults, cfg.n_strata)
         self.steps = int(cfg.T / cfg.Δt)
         self._prepare_logging()
         cfg.write_seed()
 
     def _prepare_logging(self) -> None:
-        self.rows: list[tuple[float, float, float, float]] = []
-        self.t0 = time.perf_counter()
-
-    def run(self) -> None:
-        for k in range(self.steps):
-            t = k * self.cfg.Δt
-            for s in self.strata:
-                I = self.noise.uniform(-1, 1) * self.cfg.noise.scale
-                feedback = self.G(I)
-                s.update(I, feedback, self.cfg.Δt)
-            if k % self.cfg.logging_every_step == 0:
-                self._log_step(t)
-        self._dump()
-
-    def _log_step(self, t: float) -> None:
-        C = coherence(self.strata)
-        E = effort(self.strata)
-        cpu = (time.perf_counter() - self.t0) / (len(self.rows) + 1)
-        self.rows.append((t, C, E, cpu))
+        # Rows (t, C, effort, cpu_step) are buffered in a fixed-size block and
+        # streamed to the log file whenever the block fills
+        n_rows = len(range(0, self.steps, self.cfg.logging_every_step))
+        self.rows = np.empty((min(n_rows, _FLUSH_ROWS), 4))
 
-    def _dump(self) -> None:
+    def _open_log(self) -> None:
         out = Path("data/logs")
         out.mkdir(parents=True, exist_ok=True)
         fname = out / f"{self.cfg.run_name}.{self.cfg.log_format}"
+        self.n_buffered = 0
+        self.n_logged = 0
         if self.cfg.log_format == "csv":
-            with fname.open("w", newline="") as f:
-                w = csv.writer(f)
-                w.writerow(["t", "C", "effort", "cpu_step"])
-                w.writerows(self.rows)
+            self._file = fname.open("w", newline="")
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(["t", "C", "effort", "cpu_step"])
         else:
             import h5py
 
-            with h5py.File(fname, "w") as h5:
-                h5.create_dataset("dataset", data=np.array(self.rows))
+            self._file = h5py.File(fname, "w")
+            self._dataset = self._file.create_dataset(
+                "dataset", shape=(0, 4), maxshape=(None, 4), chunks=(1024, 4),
+                dtype=self.rows.dtype,
+            )
+
+    def run(self) -> None:
+        Δt = self.cfg.Δt
+        every = self.cfg.logging_every_step
+        # The run's noise in one draw, same order as sampling one row per step; a
+        # repeated run() continues the generator stream and gets fresh noise
+        self.noise_matrix = self.noise.uniform(
+            -1, 1, (self.steps, self.cfg.n_strata)) * self.cfg.noise.scale
+        self._open_log()
+        try:
+            # Increments are tabulated per block of steps rather than for the whole run;
+            # only the noise matrix is held at full (steps, n_strata) size
+            block = max(1, _BLOCK_ELEMENTS // self.cfg.n_strata)
+            # cpu_step of the first row measures only stepping, not setup since __init__
+            self.t_prev = time.perf_counter()
+            for b0 in range(0, self.steps, block):
+                b1 = min(b0 + block, self.steps)
+                I = self.noise_matrix[b0:b1]
+                feedback = self.G(I)
+                dA = self.state.α * (1 / (1 + np.exp(-I))) - self.state.β * feedback
+                df = self.state.λ * feedback
+                fast_wrap = (self.cfg.n_strata >= _FAST_WRAP_MIN_STRATA
+                             and _phase_steps_bounded(self.state, df, Δt))
+                # Each logged step k (a multiple of every) is logged after its update
+                k = b0
+                for k_log in range(-(-b0 // every) * every, b1, every):
+                    _run_kernel(self.state, dA, df, Δt, k - b0, k_log + 1 - b0, fast_wrap)
+                    self._log_step(k_log * Δt)
+                    k = k_log + 1
+                _run_kernel(self.state, dA, df, Δt, k - b0, b1 - b0, fast_wrap)
+            self._flush()
+        finally:
+            self._file.close()
+
+    def _log_step(self, t: float) -> None:
+        C = coherence_arr(self.state.φ)
+        E = effort_arr(self.state.A)
+        # Wall time since the previous logged row, not a running average
+        now = time.perf_counter()
+        cpu = now - self.t_prev
+        self.t_prev = now
+        self.rows[self.n_buffered] = (t, C, E, cpu)
+        self.n_buffered += 1
+        if self.n_buffered == len(self.rows):
+            self._flush()
+
+    def _flush(self) -> None:
+        block = self.rows[:self.n_buffered]
+        if self.cfg.log_format == "csv":
+            self._writer.writerows(block.tolist())
+            self._file.flush()
+        else:
+            self._dataset.resize(self.n_logged + len(block), axis=0)
+            self._dataset[self.n_logged:] = block
+        self.n_logged += len(block)
+        self.n_buffered = 0
 
 
 def main(argv=None) -> None:
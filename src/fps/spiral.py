@@ -2,11 +2,22 @@ import numpy as np
 from typing import Callable
 
 
-def G_factory(kind: str) -> Callable[[float], float]:
+# Feedback functions are elementwise, so FPSSimulation evaluates them once over the
+# whole (steps, n_strata) noise table rather than once per stratum per step.
+
+def G_damped_sine(x):
+    return np.exp(-np.abs(x)) * np.sin(x)
+
+
+def G_sinc(x):
+    return np.sinc(x / np.pi)
+
+
+def G_factory(kind: str) -> Callable[[np.ndarray], np.ndarray]:
     if kind == "tanh":
-        return lambda x: np.tanh(x)
+        return np.tanh
     if kind == "damped_sine":
-        return lambda x: np.exp(-np.abs(x)) * np.sin(x)
+        return G_damped_sine
     if kind == "sinc":
-        return lambda x: np.sinc(x / np.pi)
+        return G_sinc
     raise ValueError(f"Unknown G kind: {kind}")
@@ -1,3 +1,4 @@
+import math
 import numpy as np
 from dataclasses import dataclass
 
@@ -13,7 +14,32 @@ class Stratum:
 
     def update(self, I: float, feedback: float, Δt: float) -> None:
         """Update state according to Eq. (1) discretisation."""
-        I_filt = 1 / (1 + np.exp(-I))
+        # Sign-split logistic: math.exp only sees non-positive arguments, so it cannot overflow
+        if I >= 0:
+            I_filt = 1 / (1 + math.exp(-I))
+        else:
+            e = math.exp(I)
+            I_filt = e / (1 + e)
         self.A += self.α * I_filt - self.β * feedback
         self.f += self.λ * feedback
-        self.φ = (self.φ + 2 * np.pi * self.f * Δt) % (2 * np.pi)
+        self.φ = (self.φ + 2 * math.pi * self.f * Δt) % (2 * math.pi)
+
+
+@dataclass
+class StrataState:
+    """Struct-of-arrays state for all strata, one float64 array per field."""
+    A: np.ndarray
+    f: np.ndarray
+    φ: np.ndarray
+    α: np.ndarray
+    β: np.ndarray
+    λ: np.ndarray
+
+    @classmethod
+    def from_defaults(cls, defaults, n: int) -> "StrataState":
+        """Build the state of n identical strata from a StrataDefaults config."""
+        return cls(*(
+            np.full(n, value, dtype=np.float64)
+            for value in (defaults.A0, defaults.f0, defaults.φ0,
+                          defaults.α, defaults.β, defaults.λ)
+        ))
@@ -1,15 +1,24 @@
-import csv
 from pathlib import Path
-import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
 
 
-def plot_log(path: str | Path) -> None:
-    t, C = [], []
-    with open(path, newline="") as f:
-        r = csv.DictReader(f)
-        for row in r:
-            t.append(float(row["t"]))
-            C.append(float(row["C"]))
+def plot_log(path: str | Path, out: str | Path | None = None) -> None:
+    log = pd.read_csv(path, usecols=["t", "C"], engine="c", dtype=np.float64)
+    t, C = log["t"].to_numpy(), log["C"].to_numpy()
+    if out is not None:
+        # Headless render straight to file: a bare Agg figure, no pyplot/GUI backend
+        from matplotlib.figure import Figure
+
+        fig = Figure()
+        ax = fig.subplots()
+        ax.plot(t, C)
+        ax.set_xlabel("t")
+        ax.set_ylabel("coherence")
+        fig.savefig(out)
+        return
+    import matplotlib.pyplot as plt
+
     plt.plot(t, C)
     plt.xlabel("t")
     plt.ylabel("coherence")
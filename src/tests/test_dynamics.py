@@ -10,7 +10,7 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from fps.dynamics import FPSDynamics, sigma, compute_spiral_feedback
+from fps.dynamics import FPSDynamics, sigma, compute_spiral_feedback, run_batch
 from fps.config import create_default_config
 
 
@@ -156,6 +156,47 @@ class TestDeterminism:
                                     "Same seed should produce identical C(t)")
         np.testing.assert_array_equal(results1['r'], results2['r'],
                                     "Same seed should produce identical r(t)")
+    
+    def test_extended_run_leaves_global_rng_untouched(self):
+        """Extended form is reproducible and does not consume or reseed np.random"""
+        config = create_default_config(N=5, T=2.0, seed=123)
+        
+        state_before = np.random.get_state()[1].copy()
+        results1 = FPSDynamics(config).run_simulation("step", use_extended=True)
+        state_after = np.random.get_state()[1]
+        np.testing.assert_array_equal(state_before, state_after)
+        
+        results2 = FPSDynamics(config).run_simulation("step", use_extended=True)
+        np.testing.assert_array_equal(results1['E'], results2['E'])
+        np.testing.assert_array_equal(results1['S'], results2['S'])
+    
+    def test_extended_run_unseeded(self):
+        """An unseeded config still runs the extended form"""
+        config = create_default_config(N=5, T=2.0, seed=123)
+        config['system']['seed'] = None
+        results = FPSDynamics(config).run_simulation("step", use_extended=True)
+        assert np.all(np.isfinite(results['S']))
+
+
+class TestRunBatch:
+    """Test batched runs over many configs"""
+    
+    def test_batch_matches_single_runs(self):
+        """Each batch row matches the corresponding single-config run"""
+        configs = [create_default_config(N=5, T=2.0, seed=seed) for seed in (1, 2, 3)]
+        batch = run_batch(configs, "step")
+        
+        for b, config in enumerate(configs):
+            single = FPSDynamics(config).run_simulation("step", use_extended=False)
+            for key in ('S', 'C', 'r', 'A', 'f'):
+                np.testing.assert_allclose(batch[key][b], single[key], rtol=1e-12, atol=1e-12)
+    
+    def test_batch_rejects_mismatched_shapes(self):
+        """Configs with different N cannot share a batch"""
+        configs = [create_default_config(N=5, T=2.0, seed=1),
+                   create_default_config(N=6, T=2.0, seed=1)]
+        with pytest.raises(ValueError):
+            run_batch(configs)
 
 
 if __name__ == "__main__":
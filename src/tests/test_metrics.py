@@ -1,7 +1,55 @@
-from fps.metrics import coherence
+import numpy as np
+from scipy.stats import entropy
+from fps.metrics import FPSMetrics, coherence, _second_gradient, _rolling_max_median, _rolling_entropy
 from fps.strata import Stratum
 
 
 def test_coherence_single():
     s = Stratum(1.0, 1.0, 0.0, 1.0, 0.1, 0.05, 0.01)
     assert coherence([s]) == 1.0
+
+
+def test_second_gradient_matches_nested_gradient():
+    for n in (2, 3, 4, 5, 100):
+        S = np.random.default_rng(n).normal(size=n).cumsum()
+        np.testing.assert_allclose(_second_gradient(S), np.gradient(np.gradient(S)), atol=1e-14)
+
+
+def test_rolling_max_median_matches_numpy():
+    rng = np.random.default_rng(0)
+    x = rng.integers(-3, 4, 60).astype(float)  # many ties
+    w = 7
+    maxes, medians = _rolling_max_median(x, w)
+    windows = [x[i - w:i + 1] for i in range(w, len(x))]
+    np.testing.assert_array_equal(maxes, [np.max(win) for win in windows])
+    np.testing.assert_array_equal(medians, [np.median(win) for win in windows])
+
+
+def test_rolling_entropy_matches_histogram():
+    x = np.sin(np.arange(200) * 0.1) + np.random.default_rng(1).normal(0, 0.1, 200)
+    w = 15
+    expected = []
+    for i in range(w, len(x)):
+        hist, _ = np.histogram(x[i - w:i + 1], bins=20, density=True)
+        hist = hist + 1e-10
+        expected.append(entropy(hist / hist.sum()))
+    np.testing.assert_allclose(_rolling_entropy(x, w, bins=20), expected, rtol=1e-12)
+
+
+def test_resilience_uses_pre_shock_statistics():
+    t = np.linspace(0, 10, 500)
+    S = 1 + 0.3 * np.sin(t) + np.random.default_rng(2).normal(0, 0.05, 500)
+    metrics = FPSMetrics({'time': t, 'S': S, 'C': S, 'r': S, 'cpu_times': np.ones(500)})
+    shock_idx = 200
+    baseline, tolerance = np.mean(S[:shock_idx]), 0.1 * np.std(S[:shock_idx])
+    i = next(i for i in range(shock_idx + 1, 500) if abs(S[i] - baseline) < tolerance)
+    value, _ = metrics.compute_resilience([{'time': t[shock_idx]}])
+    assert value == t[i] - t[shock_idx]
+
+
+def test_resilience_flat_pre_shock_never_returns():
+    t = np.linspace(0, 10, 80)
+    S = np.concatenate([np.full(40, 1e6 + 0.3), 1e6 + 0.3 + np.linspace(1, 0, 40) ** 2])
+    metrics = FPSMetrics({'time': t, 'S': S, 'C': S, 'r': S, 'cpu_times': np.ones(80)})
+    # std of a constant segment is 0, so no later sample is strictly within tolerance
+    assert metrics.compute_resilience([{'time': t[40]}]) == (0.0, True)
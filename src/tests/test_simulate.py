@@ -1,5 +1,8 @@
-from fps.parameters import RunConfig
-from fps.simulate import FPSSimulation
+import pytest
+import numpy as np
+from fps.parameters import RunConfig, StrataDefaults
+from fps.simulate import FPSSimulation, _phase_steps_bounded, _run_kernel
+from fps.strata import StrataState
 
 
 def test_simulation_runs(tmp_path):
@@ -12,3 +15,66 @@ def test_simulation_runs(tmp_path):
     sim.run()
     log = tmp_path / "logs" / "test.csv"
     assert log.exists()
+
+
+def test_fast_phase_wrap_matches_remainder():
+    rng = np.random.default_rng(1)
+    dA, df = rng.normal(size=(2, 200, 64)) * 0.01
+    plain = StrataState.from_defaults(StrataDefaults(), 64)
+    plain.f[:] = rng.normal(size=64) * 5  # phases wrap in both directions
+    fast = StrataState(*(a.copy() for a in vars(plain).values()))
+    assert _phase_steps_bounded(plain, df, 0.01)
+    _run_kernel(plain, dA, df, 0.01, 0, 200)
+    _run_kernel(fast, dA, df, 0.01, 0, 200, fast_wrap=True)
+    np.testing.assert_array_equal(fast.φ, plain.φ)
+
+
+def test_block_size_does_not_change_log(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    def logged(run_name):
+        cfg = RunConfig(run_name=run_name, seed=3, T=2.0, Δt=0.01, n_strata=600,
+                        noise={"scale": 0.5}, logging_every_step=7)
+        FPSSimulation(cfg).run()
+        return np.loadtxt(f"data/logs/{run_name}.csv", delimiter=",", skiprows=1)[:, :3]
+
+    whole = logged("whole")
+    monkeypatch.setattr("fps.simulate._BLOCK_ELEMENTS", 600 * 5)  # blocks of 5 steps
+    np.testing.assert_array_equal(logged("blocked"), whole)
+
+
+def test_log_is_only_written_by_run(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    cfg = RunConfig(run_name="again", T=0.5, Δt=0.01, n_strata=2, logging_every_step=5)
+    log = tmp_path / "data" / "logs" / "again.csv"
+    FPSSimulation(cfg).run()
+    before = log.read_text()
+    sim = FPSSimulation(cfg)
+    assert log.read_text() == before  # constructing must not truncate an existing log
+    sim.run()
+    sim.run()
+    assert len(log.read_text().splitlines()) == len(before.splitlines())
+
+
+def test_hdf5_log_round_trip(tmp_path, monkeypatch):
+    h5py = pytest.importorskip("h5py")
+    monkeypatch.chdir(tmp_path)
+    cfg = RunConfig(run_name="h5", seed=1, T=0.5, Δt=0.01, n_strata=3,
+                    noise={"scale": 0.5}, logging_every_step=2, log_format="hdf5")
+    sim = FPSSimulation(cfg)
+    sim.run()
+    with h5py.File(tmp_path / "data" / "logs" / "h5.hdf5", "r") as h5:
+        logged = h5["dataset"][()]
+    assert logged.dtype == np.float64
+    assert logged.shape == (25, 4)
+    np.testing.assert_array_equal(logged[:, 0], np.arange(0, 50, 2) * 0.01)
+
+
+def test_repeated_run_draws_fresh_noise(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    cfg = RunConfig(run_name="fresh", seed=4, T=0.2, Δt=0.01, n_strata=3, noise={"scale": 1.0})
+    sim = FPSSimulation(cfg)
+    sim.run()
+    first = sim.noise_matrix
+    sim.run()
+    assert not np.array_equal(sim.noise_matrix, first)
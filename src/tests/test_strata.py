@@ -0,0 +1,7 @@
+from fps.strata import Stratum
+
+
+def test_update_saturates_for_large_negative_input():
+    s = Stratum(1.0, 1.0, 0.0, 1.0, 0.1, 0.05, 0.01)
+    s.update(-1e4, 0.0, 0.01)  # exp(1e4) would overflow
+    assert s.A == 1.0